@@ -30,21 +30,32 @@ class ConfigDTO:
     #: Require headless mode or not
     headless_mode: bool
 
-class ConfigDTO:
     def __init__(
         self,
-        seed_urls: list,
-        headers: dict,
+        seed_urls: list[str],
         total_articles_to_find_and_parse: int,
+        headers: dict[str, str],
         encoding: str,
         timeout: int,
         should_verify_certificate: bool,
-        headless_mode: bool
+        headless_mode: bool,
     ):
+        """
+        Initialize an instance of the ConfigDTO class.
+
+        Args:
+            seed_urls (list[str]): Seed urls
+            total_articles_to_find_and_parse (int): Number of articles to find and parse
+            headers (dict[str, str]): Headers
+            encoding (str): Encoding
+            timeout (int): Number of seconds to wait for response
+            should_verify_certificate (bool): Should verify certificate or not
+            headless_mode (bool): Require headless mode or not
+        """
         self.seed_urls = seed_urls
-        self.total_articles_to_find_and_parse = total_articles_to_find_and_parse
+        self.total_articles = total_articles_to_find_and_parse
         self.headers = headers
         self.encoding = encoding
         self.timeout = timeout
         self.should_verify_certificate = should_verify_certificate
-        self.headless_mode = headless_mode
\ No newline at end of file
+        self.headless_mode = headless_mode
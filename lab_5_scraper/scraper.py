@@ -10,21 +10,82 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 # ──────────────────────────────────────────────────────────────────────────
 
+import hashlib
+import html
 import json
+import os
 import re
 import shutil
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Union
+from urllib.parse import urljoin, urlsplit
 
 import requests
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
 
 # Импортируем реальный Article из вашего пакета core_utils
 from core_utils.article.article import Article
+from core_utils.config_dto import ConfigDTO
 from core_utils.constants import ASSETS_PATH, CRAWLER_CONFIG_PATH
 
+# orjson (если установлен) разбирает JSON прямо из bytes; stdlib json тоже принимает bytes.
+# В requirements.txt orjson нет, так что по умолчанию работает именно запасная ветка.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads  # type: ignore[assignment]
+
+# Минимальный интервал (в секундах) между запросами к одному и тому же хосту
+REQUEST_INTERVAL = 1.0
+# Сколько страниц загружаем параллельно
+MAX_WORKERS = 8
+# Сколько раз повторяем запрос, если сервер временно недоступен
+MAX_RETRIES = 2
+_RETRY_STATUS_CODES = frozenset({502, 503, 504})
+# Сколько разобранных seed-страниц помним в кэше ссылок краулера
+HREFS_CACHE_SIZE = 100
+
+# Регулярные выражения компилируем один раз при импорте модуля
+_SEED_URL_RE = re.compile(r"https?://(?:www\.)?[\w.-]+\.\w+")
+_NEWS_URL_RE = re.compile(r"/news-\d+-\d+\.html")
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# Русские названия месяцев в родительном падеже -> номер месяца (для _unify_date)
+_RU_MONTHS = {
+    "января": "01",
+    "февраля": "02",
+    "марта": "03",
+    "апреля": "04",
+    "мая": "05",
+    "июня": "06",
+    "июля": "07",
+    "августа": "08",
+    "сентября": "09",
+    "октября": "10",
+    "ноября": "11",
+    "декабря": "12",
+}
+
+# Значение href тега <a> прямо в байтах страницы (в кавычках любого вида или без них).
+# Предыдущие атрибуты тега проходятся как токены, поэтому ">" внутри кавычек не обрывает
+# тег. Перед href должен стоять пробел или закрывающая кавычка прошлого атрибута: так
+# находится и class="x"href="...", но не data-href / ng-href / xlink:href.
+# Содержимое <script>, <style>, <textarea>, <title>, <iframe>, <xmp>, <noembed>,
+# <noframes>, всё после <plaintext> и HTML-комментарии поглощаются альтернативами
+# без href-групп: lxml не разбирает их как разметку, и в дереве BS4 ссылок оттуда нет.
+_A_HREF_RE = re.compile(
+    rb"<(?P<rawtext>script|style|textarea|title|iframe|xmp|noembed|noframes)\b"
+    rb".*?</(?P=rawtext)\s*>|<plaintext\b.*|<!--.*?-->"
+    rb"""|<a\s(?:[^>"']|"[^"]*"|'[^']*')*?(?<=[\s"'])href\s*=\s*"""
+    rb"""(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<uq>[^\s"'>]+))""",
+    re.IGNORECASE | re.DOTALL,
+)
+
 
 # -------------------------------------------------------------------
 # Исключения, которые проверяют тесты s2_1_*
@@ -57,6 +118,10 @@ class IncorrectVerifyError(Exception):
     pass
 
 
+class RequestCancelledError(Exception):
+    pass
+
+
 # -------------------------------------------------------------------
 # Класс Config: чтение и валидация JSON-конфига
 # -------------------------------------------------------------------
@@ -82,29 +147,78 @@ class Config:
       get_timeout() -> int
       get_verify_certificate() -> bool
       get_headless_mode() -> bool
+      get_session() -> requests.Session
     """
 
+    # Фиксированный набор атрибутов: без __dict__ у каждого экземпляра
+    __slots__ = (
+        "path_to_config",
+        "_config_dto",
+        "_seed_urls",
+        "_num_articles",
+        "_headers",
+        "_encoding",
+        "_timeout",
+        "_should_verify_certificate",
+        "_headless_mode",
+        "_session",
+    )
+
     def __init__(self, path_to_config: pathlib.Path) -> None:
         self.path_to_config = path_to_config
+        self._config_dto = self._extract_config_content()
         self._validate_config_content()
         self._load_and_set_attributes()
+        self._session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        """
+        Создаёт общую для всех запросов сессию: keep-alive соединения
+        переиспользуются между потоками, заголовки выставляются один раз.
+        Проверка сертификата передаётся в каждый запрос (см. make_request):
+        на уровне сессии её перекрыли бы REQUESTS_CA_BUNDLE / CURL_CA_BUNDLE.
+        """
+        # Повторы при 502/503/504 делает make_request — через ограничитель частоты
+        adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(self._headers)
+        return session
+
+    def _extract_config_content(self) -> ConfigDTO:
+        """
+        Читает JSON-конфиг один раз и раскладывает его по полям ConfigDTO.
+        Отсутствующие ключи становятся None — их отловит валидация.
+        """
+        data = _json_loads(self.path_to_config.read_bytes())
+
+        return ConfigDTO(
+            seed_urls=data.get("seed_urls"),
+            headers=data.get("headers"),
+            total_articles_to_find_and_parse=data.get("total_articles_to_find_and_parse"),
+            encoding=data.get("encoding"),
+            timeout=data.get("timeout"),
+            should_verify_certificate=data.get("should_verify_certificate"),
+            headless_mode=data.get("headless_mode"),
+        )
 
     def _load_and_set_attributes(self) -> None:
-        with open(self.path_to_config, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        dto = self._config_dto
 
         # Сохраняем поля в приватных атрибутах (имена те же, что проверяют тесты)
-        self._seed_urls = data["seed_urls"]
-        self._num_articles = data["total_articles_to_find_and_parse"]
-        self._headers = data["headers"]
-        self._encoding = data["encoding"]
-        self._timeout = data["timeout"]
-        self._should_verify_certificate = data["should_verify_certificate"]
-        self._headless_mode = data["headless_mode"]
+        self._seed_urls = dto.seed_urls
+        self._num_articles = dto.total_articles
+        self._headers = dto.headers
+        self._encoding = dto.encoding
+        self._timeout = dto.timeout
+        self._should_verify_certificate = dto.should_verify_certificate
+        self._headless_mode = dto.headless_mode
 
     def _validate_config_content(self) -> None:
         """
-        Проверяет корректность JSON-конфига. При ошибке бросает нужное исключение:
+        Проверяет корректность уже прочитанного конфига (`self._config_dto`).
+        При ошибке бросает нужное исключение:
          1) seed_urls — list[str], каждый — валидный URL.
          2) total_articles_to_find_and_parse — int > 0, ≤ 1000.
          3) headers — dict.
@@ -113,19 +227,18 @@ class Config:
          6) should_verify_certificate — bool.
          7) headless_mode — bool (иначе IncorrectVerifyError).
         """
-        with open(self.path_to_config, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        dto = self._config_dto
 
         # 1) seed_urls
-        seed_urls = data.get("seed_urls")
+        seed_urls = dto.seed_urls
         if not isinstance(seed_urls, list):
             raise IncorrectSeedURLError("Seed URLs must be a list of strings")
         for url in seed_urls:
-            if not isinstance(url, str) or not re.match(r"https?://(www\.)?[\w\.-]+\.\w+", url):
+            if not isinstance(url, str) or not _SEED_URL_RE.match(url):
                 raise IncorrectSeedURLError("Seed URLs must be a list of strings, not a single string")
 
         # 2) total_articles_to_find_and_parse
-        total = data.get("total_articles_to_find_and_parse")
+        total = dto.total_articles
         if not isinstance(total, int) or total <= 0:
             raise IncorrectNumberOfArticlesError("Num articles must be a positive integer.")
         MAX_LIMIT = 1000
@@ -133,29 +246,29 @@ class Config:
             raise NumberOfArticlesOutOfRangeError("Num articles must not be too large")
 
         # 3) headers
-        headers = data.get("headers")
+        headers = dto.headers
         if not isinstance(headers, dict):
             raise IncorrectHeadersError("Headers must be a dictionary with string keys and string values")
 
         # 4) encoding
-        encoding = data.get("encoding")
+        encoding = dto.encoding
         if not isinstance(encoding, str):
             raise IncorrectEncodingError("Encoding must be a string")
 
         # 5) timeout
-        timeout = data.get("timeout")
+        timeout = dto.timeout
         TIMEOUT_LOWER_LIMIT = 0
         TIMEOUT_UPPER_LIMIT = 60
         if not isinstance(timeout, int) or timeout < TIMEOUT_LOWER_LIMIT or timeout > TIMEOUT_UPPER_LIMIT:
             raise IncorrectTimeoutError("Num articles must be an integer between 0 and 60. 0 is a valid value")
 
         # 6) should_verify_certificate
-        verify = data.get("should_verify_certificate")
+        verify = dto.should_verify_certificate
         if not isinstance(verify, bool):
             raise IncorrectVerifyError("Verify certificate must be either True or False")
 
         # 7) headless_mode
-        headless = data.get("headless_mode")
+        headless = dto.headless_mode
         if not isinstance(headless, bool):
             # Тест test_incorrect_headless_config_param ожидает именно IncorrectVerifyError
             raise IncorrectVerifyError("Headless mode must be either True or False")
@@ -183,24 +296,100 @@ class Config:
     def get_headless_mode(self) -> bool:
         return self._headless_mode
 
+    def get_session(self) -> requests.Session:
+        return self._session
+
+
+# -------------------------------------------------------------------
+# Вежливость краулера: не чаще одного запроса в REQUEST_INTERVAL на хост
+# -------------------------------------------------------------------
+class HostRateLimiter:
+    """
+    Ограничивает частоту запросов: не чаще одного запроса в `min_interval` секунд
+    на каждый хост (ключ — `netloc` из URL). Запросы к разным хостам друг друга
+    не задерживают, а ожидание происходит вне общей блокировки. Слот занимается
+    только в момент, когда он наступил, поэтому отменённое ожидание не отнимает
+    слоты у остальных запросов.
+    """
+
+    def __init__(self, min_interval: float) -> None:
+        self._min_interval = min_interval
+        self._next_slot: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str, cancel: Union[threading.Event, None] = None) -> bool:
+        """
+        Ждёт свободного слота для хоста из `url` и занимает его.
+        Если во время ожидания выставлено событие `cancel`, сразу возвращает False,
+        не занимая слот; иначе возвращает True.
+        """
+        host = urlsplit(url).netloc
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                slot = self._next_slot.get(host, now)
+                if slot <= now:
+                    self._next_slot[host] = now + self._min_interval
+                    return True
+            if cancel is None:
+                time.sleep(slot - now)
+            elif cancel.wait(slot - now):
+                return False
+
+
+_rate_limiter = HostRateLimiter(REQUEST_INTERVAL)
+
 
 # -------------------------------------------------------------------
 # Функция make_request: делаем GET-запрос с настройками из Config
 # -------------------------------------------------------------------
-def make_request(url: str, config: Config) -> requests.Response:
+def make_request(
+    url: str, config: Config, cancel: Union[threading.Event, None] = None
+) -> requests.Response:
     """
-    Делает GET-запрос по `url` c заголовками, таймаутом и проверкой сертификата из `config`.
-    Сразу присваивает `resp.encoding = config.get_encoding()`, ждёт 1 секунду и возвращает `Response`.
+    Делает GET-запрос по `url` через общую сессию `config.get_session()`
+    (заголовки уже выставлены в ней) c таймаутом и проверкой сертификата из `config`.
+    Перед запросом выдерживает паузу для этого хоста (см. `HostRateLimiter`).
+    На ответ 502/503/504 повторяет запрос до MAX_RETRIES раз — тоже через паузу
+    для хоста; ошибки соединения и таймауты не повторяются.
+    Присваивает `response.encoding = config.get_encoding()`, чтобы `response.text`
+    декодировался кодировкой из конфига, и возвращает `Response`.
+    Если событие `cancel` выставлено, пока запрос ждёт паузу, бросает
+    RequestCancelledError, так и не отправив запрос.
     """
-    resp = requests.get(
-        url,
-        headers=config.get_headers(),
-        timeout=config.get_timeout(),
-        verify=config.get_verify_certificate(),
-    )
-    resp.encoding = config.get_encoding()
-    time.sleep(1)
-    return resp
+    for _ in range(MAX_RETRIES + 1):
+        if not _rate_limiter.wait(url, cancel):
+            raise RequestCancelledError(f"Request to {url} was cancelled")
+        response = config.get_session().get(
+            url, timeout=config.get_timeout(), verify=config.get_verify_certificate()
+        )
+        if response.status_code not in _RETRY_STATUS_CODES:
+            break
+    response.encoding = config.get_encoding()
+    return response
+
+
+# -------------------------------------------------------------------
+# Функция _find_hrefs: ссылки страницы без построения HTML-дерева
+# -------------------------------------------------------------------
+def _find_hrefs(content: bytes, encoding: str) -> list[str]:
+    """
+    Возвращает непустые href тегов <a> из HTML-страницы `content` в порядке
+    появления, за один проход регуляркой. Значения декодируются `encoding`,
+    HTML-сущности раскрываются. На сохранённых страницах сайта и на случаях из
+    тестов результат совпадает с `BeautifulSoup(..., "lxml").find_all("a", href=True)`;
+    на сильно испорченной разметке (незакрытые кавычки, <a> внутри <svg> и т. п.)
+    возможны расхождения.
+    """
+    hrefs = []
+    for match in _A_HREF_RE.finditer(content):
+        raw_href = match["dq"] or match["sq"] or match["uq"]
+        if not raw_href:
+            continue
+        href = html.unescape(raw_href.decode(encoding, errors="replace")).strip()
+        if href:
+            hrefs.append(href)
+    return hrefs
 
 
 # -------------------------------------------------------------------
@@ -218,42 +407,93 @@ class Crawler:
     def __init__(self, config: Config) -> None:
         self.config = config
         self.urls: list[str] = []
-        self.url_pattern = re.compile(r"/news-\d+-\d+\.html")
+        # Множество уже добавленных ссылок: проверка на дубликат за O(1)
+        self._seen: set[str] = set()
+        # LRU-кэш "хеш тела страницы -> href статей": одинаковые страницы не парсим повторно
+        self._hrefs_cache: OrderedDict[bytes, list[str]] = OrderedDict()
+        self._hrefs_cache_lock = threading.Lock()
+        # Выставляется, когда ссылок набрано достаточно: ждущие seed-запросы отменяются
+        self._stop = threading.Event()
+
+    def _extract_hrefs(self, content: bytes) -> list[str]:
+        """
+        Возвращает непустые href ссылок на статьи из HTML-страницы `content`.
+        Результат кэшируется по хешу содержимого (не более HREFS_CACHE_SIZE страниц).
+        """
+        key = hashlib.blake2b(content, digest_size=16).digest()
+        with self._hrefs_cache_lock:
+            cached = self._hrefs_cache.get(key)
+            if cached is not None:
+                self._hrefs_cache.move_to_end(key)
+                return cached
+
+        hrefs = [
+            href
+            for href in _find_hrefs(content, self.config.get_encoding())
+            if _NEWS_URL_RE.search(href)
+        ]
+
+        with self._hrefs_cache_lock:
+            self._hrefs_cache[key] = hrefs
+            if len(self._hrefs_cache) > HREFS_CACHE_SIZE:
+                self._hrefs_cache.popitem(last=False)
+        return hrefs
+
+    def _collect_links(self, seed_url: str) -> list[str]:
+        """
+        Загружает одну seed-страницу и возвращает полные ссылки на статьи с неё.
+        При ошибке сети или статусе != 200 возвращает пустой список.
+        """
+        try:
+            response = make_request(seed_url, self.config, cancel=self._stop)
+        except Exception:
+            return []
+
+        if response.status_code != 200:
+            return []
+
+        links = []
+        # Большинство ссылок — ровно "/news-<число>-<число>.html": для них достаточно
+        # приклеить схему и хост seed-страницы. Всё остальное (в том числе с "?" или "#",
+        # которые urljoin может отбросить) разбирает urljoin
+        seed_parts = urlsplit(seed_url)
+        origin = f"{seed_parts.scheme}://{seed_parts.netloc}"
+        for href in self._extract_hrefs(response.content):
+            if _NEWS_URL_RE.fullmatch(href):
+                links.append(origin + href)
+            else:
+                links.append(urljoin(seed_url, href))
+        return links
 
     def find_articles(self) -> None:
         """
-        Проходим по каждому URL из `config.get_seed_urls()`:
+        Параллельно (в MAX_WORKERS потоков) проходим по каждому URL из `config.get_seed_urls()`:
          1) GET через make_request(...)
          2) Если status_code != 200 — пропускаем
          3) Ищем все теги `<a href="/news-...">`, строим `full_url = urljoin(seed_url, href)`
-         4) Добавляем в `self.urls`, пока `len(self.urls) < config.get_num_articles()`
+         4) Добавляем в `self.urls` в порядке seed_urls, пока
+            `len(self.urls) < config.get_num_articles()`
 
         Если после всех seed_urls в `self.urls` меньше, чем `config.get_num_articles()`,
         дублируем последний элемент, чтобы получить нужный размер.
         """
-        for seed_url in self.config.get_seed_urls():
-            try:
-                response = make_request(seed_url, self.config)
-            except Exception:
-                continue
-
-            if response.status_code != 200:
-                continue
-
-            soup = BeautifulSoup(response.text, "html.parser")
-            for a_tag in soup.find_all("a", href=self.url_pattern):
-                href = a_tag.get("href", "").strip()
-                if not href:
-                    continue
-                full_url = urljoin(seed_url, href)
-                if full_url not in self.urls:
+        required = self.config.get_num_articles()
+        self._stop.clear()
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for links in executor.map(self._collect_links, self.config.get_seed_urls()):
+                for full_url in links:
+                    if full_url in self._seen:
+                        continue
+                    self._seen.add(full_url)
                     self.urls.append(full_url)
-                if len(self.urls) >= self.config.get_num_articles():
-                    return
+                    if len(self.urls) >= required:
+                        # Ещё не начатые и ждущие паузы seed-страницы больше не нужны
+                        self._stop.set()
+                        executor.shutdown(cancel_futures=True)
+                        return
 
         # Если реально найденных ссылок меньше требуемого —
         # дублируем последний до нужного размера списка:
-        required = self.config.get_num_articles()
         if self.urls and len(self.urls) < required:
             last = self.urls[-1]
             while len(self.urls) < required:
@@ -267,6 +507,24 @@ class Crawler:
         return self.config.get_seed_urls()
 
 
+# -------------------------------------------------------------------
+# Функция _write_atomically: запись артефакта статьи на диск
+# -------------------------------------------------------------------
+def _write_atomically(path: pathlib.Path, content: str) -> None:
+    """
+    Записывает `content` одним вызовом во временный файл рядом с `path`
+    и через `os.replace` подменяет им `path`: файл никогда не бывает записан наполовину.
+    Если запись не удалась, временный файл удаляется, чтобы не попасть в датасет.
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        tmp_path.write_text(content, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 # -------------------------------------------------------------------
 # Класс HTMLParser: парсим одну статью и сохраняем raw + meta
 # -------------------------------------------------------------------
@@ -283,6 +541,9 @@ class HTMLParser:
     Метод `parse()` возвращает либо заполненный `Article`, либо `False` при ошибке.
     """
 
+    # Парсер создаётся на каждую статью — обходимся без __dict__ у экземпляров
+    __slots__ = ("full_url", "article_id", "config", "article")
+
     def __init__(self, full_url: str, article_id: int, config: Config) -> None:
         self.full_url = full_url
         self.article_id = article_id
@@ -295,21 +556,15 @@ class HTMLParser:
         Преобразует дату из формата "YYYY-MM-DD" или "28 февраля 2024 года"
         в строку "YYYY-MM-DD". Если не удалось — возвращаем None.
         """
-        if re.match(r"\d{4}-\d{2}-\d{2}", date_str):
+        if _ISO_DATE_RE.match(date_str):
             return date_str
 
-        months_map = {
-            "января": "01", "февраля": "02", "марта": "03",
-            "апреля": "04", "мая": "05", "июня": "06",
-            "июля": "07", "августа": "08", "сентября": "09",
-            "октября": "10", "ноября": "11", "декабря": "12",
-        }
         cleaned = date_str.replace("года", "").strip()
         parts = cleaned.split()
         if len(parts) >= 3:
             day = parts[0].zfill(2)
             month_ru = parts[1].lower()
-            month = months_map.get(month_ru)
+            month = _RU_MONTHS.get(month_ru)
             year = parts[2] if parts[2].isdigit() else None
             if month and year:
                 return f"{year}-{month}-{day}"
@@ -345,7 +600,7 @@ class HTMLParser:
         if response.status_code != 200:
             return False
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = BeautifulSoup(response.content, "lxml", from_encoding=self.config.get_encoding())
 
         # 1) Заголовок
         title_tag = soup.select_one("h1.title, h1.entry-title")
@@ -386,10 +641,9 @@ class HTMLParser:
             # Удаляем нежелательные узлы
             for bad in content.select("script, .ad, .related, .comments"):
                 bad.decompose()
+            # get_text обходит всё поддерево <p>, поэтому вызываем его один раз на абзац
             paragraphs = [
-                p.get_text(strip=True)
-                for p in content.select("p")
-                if p.get_text(strip=True)
+                text for text in (p.get_text(strip=True) for p in content.select("p")) if text
             ]
             combined = "\n".join(paragraphs) if paragraphs else ""
             # Если меньше 50 символов, ставим длинную «заглушку»
@@ -402,13 +656,12 @@ class HTMLParser:
             self.article.text = "Текст отсутствует. " * 5
 
         # ────────────────────────────────────────────────────────────────
-        # Вручную сохраняем raw и meta:
+        # Вручную сохраняем raw и meta (каждый файл — одной атомарной записью):
 
         # 1) raw-текст
         raw_path = ASSETS_PATH / f"{self.article.article_id}_raw.txt"
         raw_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(raw_path, "w", encoding="utf-8") as f:
-            f.write(self.article.text)
+        _write_atomically(raw_path, self.article.text)
 
         # 2) метаданные
         meta_data = {
@@ -420,9 +673,10 @@ class HTMLParser:
             "author": self.article.author,
             "topics": self.article.topics,
         }
+        # json.dump пишет в файл множеством мелких кусков — собираем строку целиком
+        # и записываем её одним вызовом
         meta_path = ASSETS_PATH / f"{self.article.article_id}_meta.json"
-        with open(meta_path, "w", encoding="utf-8") as f:
-            json.dump(meta_data, f, ensure_ascii=False, indent=2)
+        _write_atomically(meta_path, json.dumps(meta_data, ensure_ascii=False, indent=2))
         # ────────────────────────────────────────────────────────────────
 
         return self.article
@@ -431,16 +685,54 @@ class HTMLParser:
 # -------------------------------------------------------------------
 # Функция prepare_environment: создаём/очищаем указанную папку
 # -------------------------------------------------------------------
+# Потоки, удаляющие старые копии папок; main() дожидается их перед выходом
+_cleanup_threads: list[threading.Thread] = []
+
+
+def _remove_old_dirs(old_dirs: list[pathlib.Path]) -> None:
+    """
+    Удаляет отложенные копии папок, оставшиеся после prepare_environment.
+    """
+    for old_dir in old_dirs:
+        shutil.rmtree(old_dir, ignore_errors=True)
+
+
+def _wait_for_cleanup() -> None:
+    """
+    Дожидается завершения фонового удаления, запущенного prepare_environment.
+    """
+    while _cleanup_threads:
+        _cleanup_threads.pop().join()
+
+
 def prepare_environment(base_path: Union[pathlib.Path, str]) -> None:
     """
-    Если папка base_path существует, удаляем её вместе с содержимым, затем создаём заново.
-    Если не существует, просто создаём.
+    Если папка base_path существует, атомарно переименовываем её в
+    "<имя>.old.<время>" и сразу создаём пустую папку заново. Само удаление
+    старого содержимого (как и копий, оставшихся от прошлых запусков)
+    идёт в фоновом потоке, параллельно с краулингом; main() дожидается его
+    в конце. Если процесс завершится раньше, недоудалённые "<имя>.old.<время>"
+    останутся на диске до следующего вызова prepare_environment.
+    Если по пути base_path лежит обычный файл, он удаляется.
+    Если ничего не существует, просто создаём папку.
     """
     path = pathlib.Path(base_path)
-    if path.exists():
-        shutil.rmtree(path)
+    if path.is_dir():
+        os.replace(path, path.with_name(f"{path.name}.old.{time.time_ns()}"))
+    elif path.exists() or path.is_symlink():
+        path.unlink()
     path.mkdir(parents=True, exist_ok=True)
 
+    # Только копии, созданные этой функцией: чужие "<имя>.old.*" не трогаем
+    old_name_re = re.compile(rf"{re.escape(path.name)}\.old\.\d+")
+    old_dirs = [
+        old for old in path.parent.iterdir() if old_name_re.fullmatch(old.name) and old.is_dir()
+    ]
+    if old_dirs:
+        thread = threading.Thread(target=_remove_old_dirs, args=(old_dirs,), daemon=True)
+        thread.start()
+        _cleanup_threads.append(thread)
+
 
 # -------------------------------------------------------------------
 # main(): точка входа, которую вызывает scraper_setup()
@@ -450,13 +742,20 @@ def main() -> None:
     configuration = Config(path_to_config=CRAWLER_CONFIG_PATH)
     # 2) Очищаем папку для артефактов (ASSETS_PATH)
     prepare_environment(ASSETS_PATH)
-    # 3) Запускаем краулер
-    crawler = Crawler(config=configuration)
-    crawler.find_articles()
-    # 4) Парсим каждую найденную ссылку и сохраняем raw+meta
-    for i, url in enumerate(crawler.urls[:configuration.get_num_articles()], start=1):
-        parser = HTMLParser(full_url=url, article_id=i, config=configuration)
-        parser.parse()
+    # Все запросы идут через одну сессию — по завершении закрываем её соединения
+    with configuration.get_session():
+        # 3) Запускаем краулер
+        crawler = Crawler(config=configuration)
+        crawler.find_articles()
+        # 4) Параллельно парсим каждую найденную ссылку и сохраняем raw+meta
+        parsers = [
+            HTMLParser(full_url=url, article_id=i, config=configuration)
+            for i, url in enumerate(crawler.urls[: configuration.get_num_articles()], start=1)
+        ]
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            list(executor.map(HTMLParser.parse, parsers))
+    # 5) Дожидаемся фонового удаления прошлого содержимого ASSETS_PATH
+    _wait_for_cleanup()
 
 
 if __name__ == "__main__":
@@ -3,13 +3,28 @@
 Crawler instantiation validation.
 """
 import shutil
+import threading
+import time
 import unittest
+from pathlib import Path
+from unittest import mock
+from urllib.parse import urljoin
 
 import pytest
+from bs4 import BeautifulSoup
 
 from admin_utils.test_params import TEST_PATH
 from core_utils.constants import CRAWLER_CONFIG_PATH
-from lab_5_scraper.scraper import Config, Crawler, make_request, prepare_environment
+from lab_5_scraper.scraper import (
+    _find_hrefs,
+    _wait_for_cleanup,
+    Config,
+    Crawler,
+    HostRateLimiter,
+    HREFS_CACHE_SIZE,
+    make_request,
+    prepare_environment,
+)
 
 
 class CrawlerTest(unittest.TestCase):
@@ -150,9 +165,295 @@ class PrepareEnvironmentTest(unittest.TestCase):
         self.assertTrue(TEST_PATH.exists())
         self.assertFalse(any(TEST_PATH.iterdir()))
 
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scraper
+    def test_prepare_environment_clears_existing_directory(self) -> None:
+        """
+        Ensure previous contents are gone and no swapped-out copies are left behind.
+        """
+        (TEST_PATH / "nested").mkdir()
+        (TEST_PATH / "nested" / "1_raw.txt").write_text("text", encoding="utf-8")
+        (TEST_PATH / "1_meta.json").write_text("{}", encoding="utf-8")
+
+        prepare_environment(TEST_PATH)
+        _wait_for_cleanup()
+
+        self.assertTrue(TEST_PATH.is_dir())
+        self.assertFalse(any(TEST_PATH.iterdir()))
+        self.assertFalse(list(TEST_PATH.parent.glob(f"{TEST_PATH.name}.old.*")))
+
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scraper
+    def test_prepare_environment_replaces_file_with_directory(self) -> None:
+        """
+        Ensure a regular file at the target path is replaced by an empty directory.
+        """
+        shutil.rmtree(TEST_PATH)
+        TEST_PATH.write_text("not a directory", encoding="utf-8")
+
+        prepare_environment(TEST_PATH)
+        _wait_for_cleanup()
+
+        self.assertTrue(TEST_PATH.is_dir())
+        self.assertFalse(any(TEST_PATH.iterdir()))
+        self.assertFalse(list(TEST_PATH.parent.glob(f"{TEST_PATH.name}.old.*")))
+
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scraper
+    def test_prepare_environment_keeps_unrelated_old_siblings(self) -> None:
+        """
+        Ensure sibling directories not created by prepare_environment survive.
+        """
+        backup = TEST_PATH.with_name(f"{TEST_PATH.name}.old.backup")
+        backup.mkdir()
+        (backup / "important.txt").write_text("keep me", encoding="utf-8")
+
+        prepare_environment(TEST_PATH)
+        _wait_for_cleanup()
+
+        self.assertEqual((backup / "important.txt").read_text(encoding="utf-8"), "keep me")
+        self.assertEqual(list(TEST_PATH.parent.glob(f"{TEST_PATH.name}.old.*")), [backup])
+
     def tearDown(self) -> None:
         """
         Define final instructions for PrepareEnvironmentTest class.
         """
         if TEST_PATH.exists():
             shutil.rmtree(TEST_PATH)
+        shutil.rmtree(TEST_PATH.with_name(f"{TEST_PATH.name}.old.backup"), ignore_errors=True)
+
+
+class FindHrefsTest(unittest.TestCase):
+    """
+    Class for testing regex-based link discovery against BeautifulSoup.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for FindHrefsTest class.
+        """
+        self.encoding = "windows-1251"
+        self.pages = sorted((Path(__file__).parent.parent / "articles_raw").glob("*.html"))
+
+    def _reference_hrefs(self, content: bytes) -> list[str]:
+        """
+        Collect non-empty hrefs of <a> tags the way BeautifulSoup with lxml sees them.
+        """
+        soup = BeautifulSoup(content, "lxml", from_encoding=self.encoding)
+        hrefs = (a_tag["href"].strip() for a_tag in soup.find_all("a", href=True))
+        return [href for href in hrefs if href]
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scraper
+    def test_find_hrefs_matches_beautifulsoup_on_saved_pages(self) -> None:
+        """
+        Ensure _find_hrefs() returns the same hrefs as BeautifulSoup on saved articles.
+        """
+        self.assertTrue(self.pages)
+        for page in self.pages:
+            content = page.read_bytes()
+            self.assertEqual(
+                self._reference_hrefs(content),
+                _find_hrefs(content, self.encoding),
+                f"Link discovery differs from BeautifulSoup on {page.name}",
+            )
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scraper
+    def test_find_hrefs_matches_beautifulsoup_on_edge_cases(self) -> None:
+        """
+        Ensure _find_hrefs() agrees with BeautifulSoup on tricky markup.
+        """
+        edge_cases = [
+            b'<a data-href="/news-1-2.html" href="#">x</a>',
+            b'<a ng-href="/news-1-2.html" xlink:href="/news-1-3.html">x</a>',
+            b'<a title="a>b" href="/news-3-4.html">x</a>',
+            b'<textarea><a href="/news-7-8.html">x</a></textarea>',
+            b"<script>document.write(\"<a href='/news-5-6.html'>\")</script>",
+            b'<style>.x {}<a href="/news-5-6.html"></style>',
+            b'<!-- <a href="/news-5-6.html">x</a> -->',
+            b"<A HREF='/news-1-1.html'>x</A>",
+            b"<a\nclass=x href = /news-1-1.html>x</a>",
+            b'<a href="/news-1-1.html?a=1&amp;b=2">x</a>',
+            b'<abbr href="/news-1-1.html">x</abbr>',
+            b'<a href="">x</a><a href=" /news-9-9.html ">y</a>',
+            b'<a class="x"href="/news-1-2.html">x</a>',
+            b"<a class='x'href='/news-1-3.html'>x</a>",
+            b'<iframe><a href="/news-2-3.html">x</a></iframe><a href="/news-2-4.html">y</a>',
+            b'<xmp><a href="/news-2-5.html">x</a></xmp><a href="/news-2-6.html">y</a>',
+            b'<a href="/news-2-7.html">x</a><plaintext><a href="/news-2-8.html">y</a>',
+        ]
+        for content in edge_cases:
+            self.assertEqual(
+                self._reference_hrefs(content),
+                _find_hrefs(content, self.encoding),
+                f"Link discovery differs from BeautifulSoup on {content!r}",
+            )
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scraper
+    def test_crawler_extract_hrefs_keeps_only_article_links(self) -> None:
+        """
+        Ensure Crawler keeps only /news-<number>-<number>.html links.
+        """
+        crawler = Crawler(Config(CRAWLER_CONFIG_PATH))
+        content = b'<a href="/news-16.html">a</a><a href="/news-1-2.html">b</a>'
+        self.assertEqual(["/news-1-2.html"], crawler._extract_hrefs(content))
+
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scraper
+    def test_crawler_collect_links_matches_urljoin(self) -> None:
+        """
+        Ensure full links are built exactly as urljoin builds them.
+        """
+        seed_url = "https://serdobsky.ru/dir/page.html"
+        hrefs = [
+            "/news-1-2.html",
+            "/news-1-2.html#",
+            "/news-1-2.html?",
+            "./news-1-3.html",
+            "/dir/../news-1-4.html",
+            "//serdobsky.ru/news-1-5.html",
+        ]
+        content = "".join(f'<a href="{href}">x</a>' for href in hrefs).encode()
+        response = mock.Mock(status_code=200, content=content)
+
+        crawler = Crawler(Config(CRAWLER_CONFIG_PATH))
+        with mock.patch("lab_5_scraper.scraper.make_request", return_value=response):
+            links = crawler._collect_links(seed_url)
+        self.assertEqual([urljoin(seed_url, href) for href in hrefs], links)
+
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scraper
+    def test_crawler_extract_hrefs_reuses_cached_result(self) -> None:
+        """
+        Ensure identical page bytes are scanned only once.
+        """
+        crawler = Crawler(Config(CRAWLER_CONFIG_PATH))
+        content = b'<a href="/news-1-2.html">x</a>'
+        with mock.patch("lab_5_scraper.scraper._find_hrefs", wraps=_find_hrefs) as find_hrefs:
+            first = crawler._extract_hrefs(content)
+            second = crawler._extract_hrefs(content)
+        self.assertEqual(1, find_hrefs.call_count)
+        self.assertIs(first, second)
+        self.assertEqual(["/news-1-2.html"], second)
+
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scraper
+    def test_crawler_hrefs_cache_evicts_least_recently_used(self) -> None:
+        """
+        Ensure the cache keeps at most HREFS_CACHE_SIZE pages, dropping the oldest one.
+        """
+        crawler = Crawler(Config(CRAWLER_CONFIG_PATH))
+        pages = [
+            f'<a href="/news-1-{number}.html">x</a>'.encode()
+            for number in range(HREFS_CACHE_SIZE + 1)
+        ]
+        with mock.patch("lab_5_scraper.scraper._find_hrefs", wraps=_find_hrefs) as find_hrefs:
+            for page in pages:
+                crawler._extract_hrefs(page)
+            self.assertEqual(HREFS_CACHE_SIZE, len(crawler._hrefs_cache))
+
+            crawler._extract_hrefs(pages[-1])
+            self.assertEqual(len(pages), find_hrefs.call_count)
+
+            crawler._extract_hrefs(pages[0])
+            self.assertEqual(len(pages) + 1, find_hrefs.call_count)
+        self.assertEqual(HREFS_CACHE_SIZE, len(crawler._hrefs_cache))
+
+
+class HostRateLimiterTest(unittest.TestCase):
+    """
+    Class for testing per-host request spacing.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for HostRateLimiterTest class.
+        """
+        self.interval = 0.2
+        self.limiter = HostRateLimiter(self.interval)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scraper
+    def test_same_host_requests_are_spaced(self) -> None:
+        """
+        Ensure consecutive requests to one host wait for the interval.
+        """
+        start = time.monotonic()
+        self.limiter.wait("http://example.com/news-1-1.html")
+        self.assertLess(time.monotonic() - start, self.interval)
+
+        self.limiter.wait("http://example.com/news-1-2.html")
+        self.limiter.wait("http://example.com/news-1-3.html")
+        self.assertGreaterEqual(time.monotonic() - start, 2 * self.interval)
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scraper
+    def test_different_hosts_do_not_wait(self) -> None:
+        """
+        Ensure requests to different hosts are not delayed by each other.
+        """
+        start = time.monotonic()
+        for host in ("example.com", "example.org", "www.serdobsky.ru"):
+            self.limiter.wait(f"http://{host}/news-1-1.html")
+        self.assertLess(time.monotonic() - start, self.interval)
+
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_2_crawler_check
+    @pytest.mark.lab_5_scraper
+    def test_cancelled_wait_returns_without_taking_slot(self) -> None:
+        """
+        Ensure a cancelled wait returns at once and leaves the slot to other requests.
+        """
+        url = "http://example.com/news-1-1.html"
+        self.limiter.wait(url)
+        cancel = threading.Event()
+        cancel.set()
+
+        start = time.monotonic()
+        self.assertFalse(self.limiter.wait(url, cancel))
+        self.assertLess(time.monotonic() - start, self.interval / 2)
+
+        self.assertTrue(self.limiter.wait(url))
+        self.assertLess(time.monotonic() - start, 1.5 * self.interval)
@@ -2,15 +2,17 @@
 Parser realization validation.
 """
 
-# pylint: disable=no-member, no-name-in-module, assignment-from-no-return
+# pylint: disable=no-member, no-name-in-module, assignment-from-no-return, protected-access
 import random
+import shutil
 import unittest
 
 import pytest
 
+from admin_utils.test_params import TEST_PATH
 from core_utils.article.article import Article
 from core_utils.constants import CRAWLER_CONFIG_PATH
-from lab_5_scraper.scraper import Config, Crawler, HTMLParser
+from lab_5_scraper.scraper import _write_atomically, Config, Crawler, HTMLParser
 
 
 class HTMLParserTest(unittest.TestCase):
@@ -90,3 +92,57 @@ class HTMLParserTest(unittest.TestCase):
         """
         message = "parse() method must return an Article instance with filled date"
         self.assertTrue(self.return_value.date, message)
+
+
+class WriteAtomicallyTest(unittest.TestCase):
+    """
+    A class for testing how article files are written to disk.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for WriteAtomicallyTest class.
+        """
+        TEST_PATH.mkdir(parents=True, exist_ok=True)
+        self.path = TEST_PATH / "1_raw.txt"
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_3_HTML_parser_check
+    @pytest.mark.lab_5_scraper
+    def test_write_atomically_replaces_content(self) -> None:
+        """
+        Ensure the file gets the new content and no temporary file is left.
+        """
+        _write_atomically(self.path, "старый текст")
+        _write_atomically(self.path, "Новый текст статьи")
+
+        self.assertEqual("Новый текст статьи", self.path.read_text(encoding="utf-8"))
+        self.assertEqual([self.path], list(TEST_PATH.iterdir()))
+
+    @pytest.mark.mark4
+    @pytest.mark.mark6
+    @pytest.mark.mark8
+    @pytest.mark.mark10
+    @pytest.mark.stage_2_3_HTML_parser_check
+    @pytest.mark.lab_5_scraper
+    def test_write_atomically_keeps_old_file_on_failure(self) -> None:
+        """
+        Ensure a failed write keeps the previous file and removes the temporary one.
+        """
+        _write_atomically(self.path, "старый текст")
+
+        with self.assertRaises(UnicodeEncodeError):
+            _write_atomically(self.path, "\ud800")
+
+        self.assertEqual("старый текст", self.path.read_text(encoding="utf-8"))
+        self.assertEqual([self.path], list(TEST_PATH.iterdir()))
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for WriteAtomicallyTest class.
+        """
+        if TEST_PATH.exists():
+            shutil.rmtree(TEST_PATH)